@@ -1,8 +1,46 @@
 import sys
 import qrcode
-import qrcode.image.svg
+
+# هر سلول ترمینال دو ماژول عمودی را نشان می‌دهد: (بالا, پایین) -> کاراکتر
+HALF_BLOCKS = {
+    (False, False): "█",  # هر دو روشن
+    (False, True): "▀",   # فقط بالا روشن
+    (True, False): "▄",   # فقط پایین روشن
+    (True, True): " ",    # هر دو تیره
+}
+
+
+def build_qr_matrix(config_text: str):
+    # ماتریس ماژول‌ها (True = تیره) همراه با حاشیه استاندارد؛ بدون نیاز به PIL
+    qr = qrcode.QRCode()
+    qr.add_data(config_text)
+    qr.make(fit=True)
+    return qr.get_matrix()
+
+
+def render_terminal(config_text: str, ascii_only: bool = False) -> str:
+    # ماژول‌های روشن پر می‌شوند تا روی ترمینال با پس‌زمینه تیره قابل اسکن باشد
+    matrix = build_qr_matrix(config_text)
+
+    if ascii_only:
+        # هر ماژول دو کاراکتر عرض دارد تا نسبت تصویر حفظ شود
+        return "\n".join(
+            "".join("  " if dark else "##" for dark in row) for row in matrix
+        )
+
+    # ردیف آخر در صورت فرد بودن تعداد ردیف‌ها با ماژول تیره تکمیل می‌شود
+    if len(matrix) % 2:
+        matrix = matrix + [[True] * len(matrix[0])]
+
+    lines = []
+    for top, bottom in zip(matrix[0::2], matrix[1::2]):
+        lines.append("".join(HALF_BLOCKS[pair] for pair in zip(top, bottom)))
+    return "\n".join(lines)
+
 
 def generate_qr(config_text: str, output_base: str = "qrcode"):
+    import qrcode.image.svg
+
     # PNG خروجی
     img = qrcode.make(config_text)
     png_path = f"{output_base}.png"
@@ -19,13 +57,18 @@ def generate_qr(config_text: str, output_base: str = "qrcode"):
 
 
 def main():
-    if len(sys.argv) < 2:
+    # فلگ‌های نمایش در ترمینال از آرگومان‌های موقعیتی جدا می‌شوند
+    flags = {arg for arg in sys.argv[1:] if arg in ("--tty", "--ascii")}
+    args = [arg for arg in sys.argv[1:] if arg not in flags]
+
+    if len(args) < 1:
         print("Usage: python wg_qr.py <config-file> [output-basename]")
         print("Or:    echo '<config>' | python wg_qr.py - [output-basename]")
+        print("Print to terminal instead of files: add --tty (or --ascii)")
         sys.exit(1)
 
-    input_path = sys.argv[1]
-    output_base = sys.argv[2] if len(sys.argv) > 2 else "qrcode"
+    input_path = args[0]
+    output_base = args[1] if len(args) > 1 else "qrcode"
 
     if input_path == "-":
         config_text = sys.stdin.read()
@@ -37,6 +80,10 @@ def main():
         print("Error: config is empty!")
         sys.exit(2)
 
+    if flags:
+        print(render_terminal(config_text, ascii_only="--ascii" in flags))
+        return
+
     generate_qr(config_text, output_base)
 
 